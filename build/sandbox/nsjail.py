@@ -22,6 +22,7 @@ an interactive bash shell.
 
 import argparse
 import collections
+import functools
 import os
 import re
 import subprocess
@@ -30,6 +31,8 @@ from .overlay import BindOverlay
 
 _DEFAULT_META_ANDROID_DIR = 'LINUX/android'
 _DEFAULT_COMMAND = '/bin/bash'
+# Default source dir for run() and get_command(), resolved once at import
+_DEFAULT_SOURCE_DIR = os.getcwd()
 
 _SOURCE_MOUNT_POINT = '/src'
 _OUT_MOUNT_POINT = '/src/out'
@@ -83,7 +86,7 @@ def run(command,
         chroot,
         overlay_config=None,
         rw_whitelist_config=None,
-        source_dir=os.getcwd(),
+        source_dir=_DEFAULT_SOURCE_DIR,
         out_dirname_for_whiteout=None,
         dist_dir=None,
         build_id=None,
@@ -179,7 +182,7 @@ def get_command(command,
         chroot,
         overlay_config=None,
         rw_whitelist_config=None,
-        source_dir=os.getcwd(),
+        source_dir=_DEFAULT_SOURCE_DIR,
         out_dirname_for_whiteout=None,
         dist_dir=None,
         build_id=None,
@@ -327,10 +330,12 @@ def get_command(command,
     # a lot of host operating system device space, so it's recommended to use
     # the mount_local_device option only when you need to use adb (e.g., for
     # atest or some other purpose).
-    nsjail_command.extend(['--bindmount', '/dev/bus/usb'])
-    nsjail_command.extend(['--bindmount', '/sys/bus/usb/devices'])
-    nsjail_command.extend(['--bindmount', '/sys/dev'])
-    nsjail_command.extend(['--bindmount', '/sys/devices'])
+    nsjail_command.extend([
+      '--bindmount', '/dev/bus/usb',
+      '--bindmount', '/sys/bus/usb/devices',
+      '--bindmount', '/sys/dev',
+      '--bindmount', '/sys/devices',
+    ])
 
   for mount in extra_bind_mounts:
     nsjail_command.extend(['--bindmount', mount])
@@ -342,8 +347,7 @@ def get_command(command,
 
   nsjail_command.extend(extra_nsjail_args)
 
-  nsjail_command.append('--')
-  nsjail_command.extend(command)
+  nsjail_command.extend(['--', *command])
 
   return nsjail_command
 
@@ -388,11 +392,14 @@ def run_command(nsjail_command,
   if not dry_run:
     subprocess.check_call(nsjail_command, stdout=stdout, stderr=stderr)
 
-def parse_args():
-  """Parse command line arguments.
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+  """Builds the command line argument parser.
+
+  The parser is built once and reused on later calls.
 
   Returns:
-    An argparse.Namespace object.
+    An argparse.ArgumentParser object.
   """
 
   # Use the top level module docstring for the help description
@@ -415,8 +422,8 @@ def parse_args():
       help='Path to the read/write whitelist configuration file.')
   parser.add_argument(
       '--source_dir',
-      default=os.getcwd(),
-      help='Path to Android platform source to be mounted as /src.')
+      help='Path to Android platform source to be mounted as /src. '
+      'Defaults to the current directory.')
   parser.add_argument(
       '--out_dir',
       help='Full path to the Android build out folder. If not provided, uses '
@@ -502,7 +509,20 @@ def parse_args():
       action='append',
       help='Specify an environment variable to the NSJail sandbox. Can be specified '
       'muliple times. Syntax: var_name=value')
-  return parser.parse_args()
+  return parser
+
+def parse_args():
+  """Parse command line arguments.
+
+  Returns:
+    An argparse.Namespace object.
+  """
+  args = _get_parser().parse_args()
+  # The parser is cached, so the current directory default
+  # has to be resolved on every call
+  if args.source_dir is None:
+    args.source_dir = os.getcwd()
+  return args
 
 def run_with_args(args):
   """Run inside an NsJail sandbox.
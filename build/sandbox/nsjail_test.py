@@ -18,6 +18,7 @@ import os
 import subprocess
 import tempfile
 import unittest
+from unittest import mock
 from . import nsjail
 
 
@@ -26,25 +27,6 @@ class NsjailTest(unittest.TestCase):
   def setUp(self):
     nsjail.__file__ = '/'
 
-  def testMinimalParameters(self):
-    commands = nsjail.run(
-        nsjail_bin='/bin/true',
-        chroot='/chroot',
-        source_dir='/source_dir',
-        command=['/bin/bash'],
-        android_target='target_name',
-        dry_run=True)
-    self.assertEqual(
-        commands,
-        [
-            '/bin/true',
-            '--env', 'USER=nobody',
-            '--config', '/nsjail.cfg',
-            '--bindmount', '/source_dir:/src',
-            '--', '/bin/bash'
-        ]
-    )
-
   def testSetBadMetaAndroidDir(self):
     os.chdir('/')
     with self.assertRaises(ValueError):
@@ -83,92 +65,61 @@ class NsjailTest(unittest.TestCase):
           command=['/bin/bash'],
           android_target='target_name')
 
-  def testDist(self):
-    commands = nsjail.run(
-        nsjail_bin='/bin/true',
-        chroot='/chroot',
-        source_dir='/source_dir',
-        command=['/bin/bash'],
-        android_target='target_name',
-        dist_dir='/dist_dir',
-        dry_run=True)
-    self.assertEqual(
-        commands,
-        [
-            '/bin/true',
-            '--env', 'USER=nobody',
-            '--config', '/nsjail.cfg',
+  def testSourceDirDefaultsToCurrentDir(self):
+    argv = ['nsjail', '--nsjail_bin', '/bin/true',
+            '--android_target', 'target_name']
+    cwd = os.getcwd()
+    try:
+      with mock.patch('sys.argv', argv):
+        os.chdir('/')
+        self.assertEqual(nsjail.parse_args().source_dir, '/')
+        os.chdir(tempfile.gettempdir())
+        self.assertEqual(nsjail.parse_args().source_dir, os.getcwd())
+    finally:
+      os.chdir(cwd)
+
+  def testDryRunCommands(self):
+    base_command = [
+        '/bin/true',
+        '--env', 'USER=nobody',
+        '--config', '/nsjail.cfg',
+    ]
+    cases = [
+        ('minimal', {}, [
+            '--bindmount', '/source_dir:/src',
+        ]),
+        ('dist', {'dist_dir': '/dist_dir'}, [
             '--env', 'DIST_DIR=/dist',
             '--bindmount', '/source_dir:/src',
             '--bindmount', '/dist_dir:/dist',
-            '--', '/bin/bash'
-        ]
-    )
-
-  def testBuildID(self):
-    commands = nsjail.run(
-        nsjail_bin='/bin/true',
-        chroot='/chroot',
-        source_dir='/source_dir',
-        command=['/bin/bash'],
-        android_target='target_name',
-        build_id='0',
-        dry_run=True)
-    self.assertEqual(
-        commands,
-        [
-            '/bin/true',
-            '--env', 'USER=nobody',
-            '--config', '/nsjail.cfg',
+        ]),
+        ('build_id', {'build_id': '0'}, [
             '--env', 'BUILD_NUMBER=0',
             '--bindmount', '/source_dir:/src',
-            '--', '/bin/bash'
-        ]
-    )
-
-  def testMaxCPU(self):
-    commands = nsjail.run(
-        nsjail_bin='/bin/true',
-        chroot='/chroot',
-        source_dir='/source_dir',
-        command=['/bin/bash'],
-        android_target='target_name',
-        max_cpus=1,
-        dry_run=True)
-    self.assertEqual(
-        commands,
-        [
-            '/bin/true',
-            '--env', 'USER=nobody',
-            '--config', '/nsjail.cfg',
+        ]),
+        ('max_cpus', {'max_cpus': 1}, [
             '--max_cpus=1',
             '--bindmount', '/source_dir:/src',
-            '--', '/bin/bash'
-        ]
-    )
-
-  def testEnv(self):
-    commands = nsjail.run(
-        nsjail_bin='/bin/true',
-        chroot='/chroot',
-        source_dir='/source_dir',
-        command=['/bin/bash'],
-        android_target='target_name',
-        max_cpus=1,
-        dry_run=True,
-        env=['foo=bar', 'spam=eggs'])
-    self.assertEqual(
-        commands,
-        [
-            '/bin/true',
-            '--env', 'USER=nobody',
-            '--config', '/nsjail.cfg',
+        ]),
+        ('env', {'max_cpus': 1, 'env': ['foo=bar', 'spam=eggs']}, [
             '--max_cpus=1',
             '--bindmount', '/source_dir:/src',
             '--env', 'foo=bar', '--env', 'spam=eggs',
-            '--', '/bin/bash'
-        ]
-    )
+        ]),
+    ]
+    for name, kwargs, expected_args in cases:
+      with self.subTest(name=name):
+        commands = nsjail.run(
+            nsjail_bin='/bin/true',
+            chroot='/chroot',
+            source_dir='/source_dir',
+            command=['/bin/bash'],
+            android_target='target_name',
+            dry_run=True,
+            **kwargs)
+        self.assertEqual(
+            commands,
+            base_command + expected_args + ['--', '/bin/bash'])
 
 
 if __name__ == '__main__':
@@ -23,6 +23,7 @@ from __future__ import division
 from __future__ import print_function
 
 import collections
+import functools
 import os
 import subprocess
 import tempfile
@@ -367,9 +368,31 @@ class BindOverlay(object):
     if self._overlay_dirs:
       print('Stripped out overlay ' + ' '.join(self._overlay_dirs))
 
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_file, file_version):
+  """Parses the overlay configuration file.
+
+  The result is cached keyed by path and file version so the file is
+  only parsed again after it changes.
+
+  Args:
+    config_file: A string path to the XML config file.
+    file_version: A tuple of the config file device, inode, size,
+      modification time and status change time. The status change time
+      cannot be set by utime, so it catches rewrites that restore mtime.
+
+  Returns:
+    A root config XML Element.
+  """
+  with open(config_file, 'rb') as f:
+    return ET.parse(f).getroot()
+
 def get_config(config_file):
   """Parses the overlay configuration file.
 
+  Parsed configs are cached, so repeated calls for an unchanged file
+  return the same root Element. Callers must not modify it.
+
   Args:
     config_file: A string path to the XML config file.
 
@@ -377,11 +400,19 @@ def get_config(config_file):
     A root config XML Element.
     None if there is no config file.
   """
-  config = None
-  if os.path.exists(config_file):
-    tree = ET.parse(config_file)
-    config = tree.getroot()
-  return config
+  # Treat any path that cannot be stat'ed as missing,
+  # the same way os.path.exists does
+  try:
+    stat = os.stat(config_file)
+  except (OSError, ValueError):
+    return None
+  try:
+    return _parse_config(config_file, (
+        stat.st_dev, stat.st_ino, stat.st_size,
+        stat.st_mtime_ns, stat.st_ctime_ns))
+  except FileNotFoundError:
+    # The file was removed after it was stat'ed
+    return None
 
 def get_overlay_map(config_file):
   """Retrieves the map of overlays for each target.
@@ -398,9 +429,9 @@ def get_overlay_map(config_file):
   config = get_config(config_file)
   # The presence of the config file is optional
   if config:
-    for target in config.findall('target'):
+    for target in config.iterfind('target'):
       name = target.get('name')
-      overlay_list = [o.get('name') for o in target.findall('overlay')]
+      overlay_list = [o.get('name') for o in target.iterfind('overlay')]
       overlay_map[name] = overlay_list
     # A valid configuration file is required
     # to have at least one overlay target
@@ -429,19 +460,19 @@ def get_fs_view_map(config_file):
     # A valid config file is not required to
     # include FS Views, only overlay targets
     views = {}
-    for view in config.findall('view'):
+    for view in config.iterfind('view'):
       name = view.get('name')
       paths = []
-      for path in view.findall('path'):
+      for path in view.iterfind('path'):
         paths.append((
               path.get('source'),
               path.get('destination')))
       views[name] = paths
 
-    for target in config.findall('target'):
+    for target in config.iterfind('target'):
       target_name = target.get('name')
       view_paths = []
-      for view in target.findall('view'):
+      for view in target.iterfind('view'):
         view_paths.extend(views[view.get('name')])
 
       if view_paths:
@@ -247,6 +247,46 @@ class BindOverlayTest(unittest.TestCase):
             target='unknown',
             source_dir=self.source_dir)
 
+  def testMissingConfig(self):
+    self.assertIsNone(overlay.get_config(
+        os.path.join(self.source_dir, 'missing.xml')))
+    # A path below a regular file cannot exist either
+    with tempfile.NamedTemporaryFile('w+t') as test_file:
+      self.assertIsNone(overlay.get_config(
+          os.path.join(test_file.name, 'config.xml')))
+
+  def testConfigReloadedAfterChange(self):
+    with tempfile.NamedTemporaryFile('w+t') as test_config:
+      test_config.write(
+        '<?xml version="1.0" encoding="UTF-8" ?>'
+        '<config>'
+        '  <target name="unittest">'
+        '    <overlay name="unittest1"/>'
+        '  </target>'
+        '</config>'
+        )
+      test_config.flush()
+      self.assertEqual(overlay.get_overlay_map(test_config.name),
+                       {'unittest': ['unittest1']})
+      stat = os.stat(test_config.name)
+      test_config.seek(0)
+      test_config.truncate()
+      test_config.write(
+        '<?xml version="1.0" encoding="UTF-8" ?>'
+        '<config>'
+        '  <target name="testunit">'
+        '    <overlay name="unittest2"/>'
+        '  </target>'
+        '</config>'
+        )
+      test_config.flush()
+      # Keep the original size and mtime to simulate an in place rewrite
+      # on a coarse-mtime filesystem
+      self.assertEqual(os.stat(test_config.name).st_size, stat.st_size)
+      os.utime(test_config.name, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+      self.assertEqual(overlay.get_overlay_map(test_config.name),
+                       {'testunit': ['unittest2']})
+
 
 if __name__ == '__main__':
   unittest.main()